@@ -4,7 +4,7 @@ Complete scraping logic extracted from app.py
 
 This module contains:
 - ETF database (all 20 ETFs)
-- NSE scraping with Selenium
+- NSE quote API over HTTP (Selenium fallback)
 - AMC website fallback scrapers
 - Parallel batch processing
 """
@@ -12,22 +12,30 @@ This module contains:
 import time
 import re
 import os
+import queue
+import atexit
+import pickle
+import functools
+import threading
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from datetime import datetime
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from datetime import datetime, timedelta
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
+import numpy as np
 try:
-    from .mcx_scraper import get_mcx_spot_prices  # For package import
+    from .mcx_scraper import atomic_write, get_mcx_spot_prices  # For package import
 except ImportError:
-    from mcx_scraper import get_mcx_spot_prices   # For direct execution
+    from mcx_scraper import atomic_write, get_mcx_spot_prices   # For direct execution
 
 
 # Setup logging
@@ -38,30 +46,55 @@ logger = logging.getLogger(__name__)
 # STATIC DATA CACHE CONFIGURATION
 # ============================================================================
 
-STATIC_CACHE_FILE = 'etf_static_cache.csv'
-STATIC_CACHE_FILE_DATA = 'data/etf_static_cache.csv'
-STATIC_CACHE_TTL = 8 * 60 * 60  # 4 hours in seconds
+STATIC_CACHE_FILE_DATA = 'data/etf_static_cache.csv'   # Published for the frontend
+STATIC_CACHE_PICKLE = '.cache/etf_static_cache.pkl'     # Scraper-local binary copy (gitignored, never published)
+MARKET_OPEN = (9, 15)  # NSE session opens 9:15 AM IST
+
+# In-process memo: repeat loads skip file I/O entirely
+_static_cache_state = {'data': {}}
+
+def current_trading_date(now=None):
+    """
+    NSE session the static fields belong to (IST date string)
+    prevClose / open / 52W high only change when a new session opens, so before
+    9:15 AM and on weekends this is still the last weekday's session.
+    """
+    now = now or datetime.now()
+    day = now.date()
+    if now.weekday() < 5 and (now.hour, now.minute) < MARKET_OPEN:
+        day -= timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day.isoformat()
+
+def _load_static_pickle():
+    """Read the binary static cache -> {symbol: entry}, or None if unavailable"""
+    try:
+        with open(STATIC_CACHE_PICKLE, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
 
 def load_static_cache():
-    """Load static data from cache file"""
+    """Load static data from cache file (freshness is per symbol - see stale_static_symbols)"""
     try:
+        if _static_cache_state['data']:
+            return _static_cache_state['data']
+
+        # Binary cache first: no CSV parsing, no Pandas in the hot path
+        static_data = _load_static_pickle()
+        if static_data:
+            _static_cache_state['data'] = static_data
+            logger.info(f"✅ Loaded {len(static_data)} ETFs from static cache")
+            return static_data
+
         if not os.path.exists(STATIC_CACHE_FILE_DATA):
             logger.info("📂 No static cache found")
             return {}
         
         df = pd.read_csv(STATIC_CACHE_FILE_DATA)
-        
-        if 'timestamp' in df.columns and len(df) > 0:
-            cache_time = datetime.fromisoformat(df['timestamp'].iloc[0])
-            age_seconds = (datetime.now() - cache_time).total_seconds()
-            
-            if age_seconds > STATIC_CACHE_TTL:
-                logger.info("⚠️ Static cache expired (>4 hours old)")
-                return {}
-        
-        static_data = {}
-        for _, row in df.iterrows():
-            static_data[row['symbol']] = row.to_dict()
+        static_data = {record['symbol']: record for record in df.to_dict('records')}
+        _static_cache_state['data'] = static_data
         
         logger.info(f"✅ Loaded {len(static_data)} ETFs from static cache")
         return static_data
@@ -70,35 +103,27 @@ def load_static_cache():
         return {}
 
 def save_static_cache(static_data_list):
-    """Save static data to cache file"""
+    """Save static data to cache file (entries keep the timestamp of their own scrape)"""
     try:
-        timestamp = datetime.now().isoformat()
-        for entry in static_data_list:
-            entry['timestamp'] = timestamp
-        
         df = pd.DataFrame(static_data_list)
-        df.to_csv(STATIC_CACHE_FILE_DATA, index=False)
+        with atomic_write(STATIC_CACHE_FILE_DATA, newline='', encoding='utf-8') as f:
+            df.to_csv(f, index=False)
+        _static_cache_state['data'] = {entry['symbol']: entry for entry in static_data_list}
+        os.makedirs(os.path.dirname(STATIC_CACHE_PICKLE), exist_ok=True)
+        with atomic_write(STATIC_CACHE_PICKLE, 'wb') as f:
+            pickle.dump(_static_cache_state['data'], f, protocol=5)
         logger.info(f"💾 Saved {len(static_data_list)} ETFs to static cache")
         return True
-    except Exception as e:
+    except (OSError, pickle.PicklingError) as e:
         logger.error(f"❌ Failed to save static cache: {e}")
         return False
 
-def should_refresh_static_cache(static_cache):
-    """Check if static cache needs refresh"""
-    if not static_cache:
-        return True
-    
-    try:
-        df = pd.read_csv(STATIC_CACHE_FILE_DATA)
-        if 'timestamp' in df.columns and len(df) > 0:
-            cache_time = datetime.fromisoformat(df['timestamp'].iloc[0])
-            age_seconds = (datetime.now() - cache_time).total_seconds()
-            if age_seconds > STATIC_CACHE_TTL:
-                return True
-        return False
-    except:
-        return True
+def stale_static_symbols(static_cache, trading_date=None):
+    """Symbols whose cached static fields are missing or from an earlier trading session"""
+    trading_date = trading_date or current_trading_date()
+    return [symbol for symbol in ETF_SYMBOLS
+            if static_cache.get(symbol, {}).get('trading_date') != trading_date]
+
 # ============================================================================
 # ETF DATABASE - ALL 20 ETFs
 # ============================================================================
@@ -133,16 +158,39 @@ ETF_DATABASE = {
 # Flatten for easy access
 ETF_LIST = ETF_DATABASE['gold_etfs'] + ETF_DATABASE['silver_etfs']
 
+# O(1) symbol lookups
+ETF_BY_SYMBOL = {e['symbol']: e for e in ETF_LIST}
+
+# Symbols in ETF_LIST order
+ETF_SYMBOLS = tuple(e['symbol'] for e in ETF_LIST)
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Pre-compiled patterns (hot path: called once per scraped cell)
+_NUM_CLEAN_RE = re.compile(r'[^0-9.-]')
+# Deletes every ASCII char except [0-9.-], plus the ₹ / nbsp seen on AMC pages
+_NUM_DELETE_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if chr(c) not in '0123456789.-'
+) + '₹\xa0')
+_INAV_360_RE = re.compile(r'iNAV.*?₹.*?\-\s*([0-9]{2,3}\.[0-9]{2})', re.IGNORECASE)
+_INAV_HDFC_RE = re.compile(r'iNAV.*?₹\s*([0-9]{2,3}\.[0-9]{2})', re.IGNORECASE | re.DOTALL)
+
+def clean_numeric(value):
+    """Strip everything except digits, '.' and '-' from a price string"""
+    cleaned = str(value).translate(_NUM_DELETE_TABLE)
+    if not cleaned.isascii():
+        # Rare: some other non-ASCII symbol survived the table
+        cleaned = _NUM_CLEAN_RE.sub('', cleaned)
+    return cleaned
+
 def safe_float(value, default=0.0):
     """Safely convert value to float"""
     try:
         if value is None or value == '':
             return default
-        cleaned = re.sub(r'[^0-9.-]', '', str(value).strip())
+        cleaned = clean_numeric(value)
         return float(cleaned) if cleaned else default
     except:
         return default
@@ -152,15 +200,185 @@ def safe_int(value, default=0):
     try:
         if value is None or value == '':
             return default
-        cleaned = re.sub(r'[^0-9.-]', '', str(value).strip())
+        cleaned = clean_numeric(value)
         return int(float(cleaned)) if cleaned else default
     except:
         return default
 
 # ============================================================================
-# AMC WEBSITE iNAV SCRAPERS
+# AMC WEBSITE iNAV SCRAPERS (STATIC HTTP - NO CHROME)
 # ============================================================================
 
+SBI_INAV_URL = "https://etf.sbimf.com/Home/inav"
+UTI_INAV_URL = "https://www.utimf.com/mutual-funds/nav-dividend"
+HDFC_INAV_URL = "https://www.hdfcfund.com/explore/mutual-funds/hdfc-silver-etf/regular"
+ETFJUNCTION_INAV_URL = "https://etfjunction.com/inav.php"
+
+# Shared keep-alive session: repeat calls skip the TCP + TLS handshake
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_HTTP_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate',
+})
+
+AMC_PAGE_TTL = 60  # Seconds a fetched AMC page is reused (gold + silver share one page)
+
+def cached_ttl(seconds):
+    """
+    Memoize a one-argument function for `seconds`.
+    Concurrent callers with the same key wait for one call instead of duplicating it.
+    None results are not cached.
+    """
+    def decorator(fn):
+        cache = {}
+        locks = {}
+        guard = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(key):
+            with guard:
+                lock = locks.setdefault(key, threading.Lock())
+            with lock:
+                hit = cache.get(key)
+                if hit and (time.time() - hit[0]) < seconds:
+                    return hit[1]
+                value = fn(key)
+                if value is not None:
+                    cache[key] = (time.time(), value)
+                return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+@cached_ttl(seconds=AMC_PAGE_TTL)
+def fetch_page_content(url):
+    """Raw page bytes over the shared HTTP session (None on failure)"""
+    try:
+        response = _HTTP_SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        return response.content
+    except Exception as e:
+        logger.warning(f"⚠️ HTTP fetch failed for {url}: {str(e)[:100]}")
+        return None
+
+def fetch_static_page(url):
+    """Fetch a page over plain HTTP and parse it with lxml (None on failure)"""
+    content = fetch_page_content(url)
+    return lxml_html.fromstring(content) if content else None
+
+def cell_text(cell):
+    """Return the stripped text content of an lxml element"""
+    return cell.text_content().strip()
+
+def parse_sbi_inav(tree, symbol):
+    """Parse SBI iNAV from page HTML (lxml tree)"""
+    if tree is None:
+        return 0.0
+
+    # Label match done by libxml2 in one XPath query (case-insensitive via translate)
+    search_text = "gold etf" if symbol == "SETFGOLD" else "silver etf"
+    cells = tree.xpath(
+        "//*[@id='navTable']//tr[contains(translate(normalize-space(.), "
+        "'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), $label)]/td[2]",
+        label=search_text
+    )
+    for cell in cells:
+        inav = safe_float(cell_text(cell))
+        if inav > 0:
+            logger.info(f"🏦 SBI {symbol}: iNAV = ₹{inav} (html)")
+            return inav
+    return 0.0
+
+def parse_uti_inav(tree, symbol):
+    """Parse UTI iNAV from page HTML (lxml tree)"""
+    if tree is None:
+        return 0.0
+
+    def row_inav(row):
+        cells = row.xpath("./td")
+        if len(cells) < 2:
+            return 0.0
+        return safe_float(cell_text(cells[1]).replace('₹', '').replace(',', ''))
+
+    # Direct ID lookup first: the myDiv9 parent row is the gold ETF row
+    for row in tree.xpath("//*[@id='myDiv9']/.."):
+        inav = row_inav(row)
+        if inav > 0:
+            logger.info(f"🏛️ UTI {symbol}: iNAV = ₹{inav} (html)")
+            return inav
+
+    # Otherwise only rows that name the gold ETF
+    for row in tree.xpath("//tr"):
+        cells = row.xpath("./td")
+        if not cells:
+            continue
+        name_cell = cell_text(cells[0]).lower()
+        if "gold exchange traded fund" not in name_cell and "gold etf" not in name_cell:
+            continue
+        inav = row_inav(row)
+        if inav > 0:
+            logger.info(f"🏛️ UTI {symbol}: iNAV = ₹{inav} (html)")
+            return inav
+    return 0.0
+
+def parse_hdfc_inav(tree, symbol):
+    """Parse HDFC iNAV from page HTML (lxml tree)"""
+    if tree is None:
+        return 0.0
+
+    for elem in tree.xpath("//p[contains(@class, 'style_description__kIUXb')]"):
+        text = cell_text(elem)
+        if '₹' in text:
+            inav = safe_float(text.replace('₹', '').replace(',', ''))
+            if 100 < inav < 200:
+                logger.info(f"🏦 HDFC {symbol}: iNAV = ₹{inav} (html)")
+                return inav
+    return 0.0
+
+def parse_etfjunction_inav(tree, symbol):
+    """Parse ETF Junction iNAV from page HTML (lxml tree)"""
+    if tree is None:
+        return 0.0
+
+    for row in tree.xpath("//table[contains(@class, 'etftable_ab')]//tr"):
+        cells = row.xpath("./td")
+        if len(cells) >= 4 and cell_text(cells[1]) == symbol:
+            inav = safe_float(cell_text(cells[3]))
+            if inav > 0:
+                logger.info(f"📊 ETFJunction {symbol}: iNAV = ₹{inav} (html)")
+                return inav
+    return 0.0
+
+# symbol -> (AMC iNAV page, HTML parser)
+AMC_PAGES = {
+    'BSLGOLDETF': (ETFJUNCTION_INAV_URL, parse_etfjunction_inav),
+    'SILVER': (ETFJUNCTION_INAV_URL, parse_etfjunction_inav),
+    'SETFGOLD': (SBI_INAV_URL, parse_sbi_inav),
+    'SBISILVER': (SBI_INAV_URL, parse_sbi_inav),
+    'GOLDSHARE': (UTI_INAV_URL, parse_uti_inav),
+    'HDFCSILVER': (HDFC_INAV_URL, parse_hdfc_inav),
+}
+
+def scrape_amc_inav_http(symbol):
+    """
+    Try the AMC iNAV page over plain HTTP before falling back to Chrome.
+    Returns 0.0 if the page needs JS rendering (target rows not in static HTML).
+    """
+    try:
+        if symbol == "GOLD360":
+            return scrape_360one_inav(symbol)
+        if symbol in AMC_PAGES:
+            url, parser = AMC_PAGES[symbol]
+            return parser(fetch_static_page(url), symbol)
+        return 0.0
+    except Exception as e:
+        logger.warning(f"⚠️ {symbol}: HTTP iNAV parsing failed - {str(e)[:100]}")
+        return 0.0
+
 def scrape_360one_inav(symbol):
     """Scrape from 360 ONE archive site"""
     try:
@@ -169,10 +387,11 @@ def scrape_360one_inav(symbol):
         else:
             url = "https://archive.iiflmf.com/our-funds/etf/360-one-silver-etf"
 
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+        content = fetch_page_content(url)
+        if not content:
+            return 0.0
 
-        match = re.search(r'iNAV.*?₹.*?\-\s*([0-9]{2,3}\.[0-9]{2})', response.text, re.IGNORECASE)
+        match = _INAV_360_RE.search(content.decode('utf-8', errors='replace'))
         if match:
             inav = safe_float(match.group(1))
             logger.info(f"🌐 360ONE {symbol}: iNAV = ₹{inav}")
@@ -184,26 +403,50 @@ def scrape_360one_inav(symbol):
         logger.error(f"❌ 360ONE {symbol} scraping failed: {str(e)}")
         return 0.0
 
+# ============================================================================
+# AMC WEBSITE iNAV SCRAPERS (SELENIUM - JS-RENDERED PAGES)
+# ============================================================================
+
+# In-browser row search: returns ONLY the target cell text (one WebDriver round-trip)
+# args: row selector, search text, match cell index (-1 = whole row), value cell index, exact match
+_EXTRACT_CELL_JS = """
+const [sel, text, matchIdx, valueIdx, exact] = arguments;
+for (const tr of document.querySelectorAll(sel)) {
+    const tds = tr.querySelectorAll('td');
+    if (tds.length <= Math.max(matchIdx, valueIdx)) continue;
+    const hay = (matchIdx < 0 ? tr.innerText : tds[matchIdx].innerText).trim();
+    if (exact ? hay === text : hay.toLowerCase().includes(text)) return tds[valueIdx].innerText.trim();
+}
+return null;
+"""
+
+# Text of every element matching a selector, in one round-trip
+_ELEMENT_TEXTS_JS = "return Array.from(document.querySelectorAll(arguments[0])).map(e => e.innerText.trim());"
+
+def extract_table_cell(driver, row_selector, text, value_index, match_index=-1, exact=False):
+    """Find the first row matching text in the browser and return its value cell text (None if absent)"""
+    search = text if exact else text.lower()
+    return driver.execute_script(_EXTRACT_CELL_JS, row_selector, search, match_index, value_index, exact)
+
 def scrape_sbi_inav(driver, symbol):
     """Scrape from SBI ETF Portal"""
     try:
         logger.info(f"🏦 SBI: Attempting to scrape {symbol}...")
-        driver.get("https://etf.sbimf.com/Home/inav")
-        time.sleep(4)
+        driver.get(SBI_INAV_URL)
+
+        try:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "#navTable tr td")))
+        except TimeoutException:
+            logger.warning(f"⚠️ SBI {symbol}: Timeout waiting for iNAV table")
+            return 0.0
 
         search_text = "Gold ETF" if symbol == "SETFGOLD" else "Silver ETF"
 
         try:
-            rows = driver.find_elements(By.CSS_SELECTOR, "#navTable tr")
-            for row in rows:
-                if search_text.lower() in row.text.lower():
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if len(cells) >= 2:
-                        inav_text = cells[1].text.strip()
-                        inav = safe_float(inav_text)
-                        if inav > 0:
-                            logger.info(f"🏦 SBI {symbol}: iNAV = ₹{inav}")
-                            return inav
+            inav = safe_float(extract_table_cell(driver, "#navTable tr", search_text, 1))
+            if inav > 0:
+                logger.info(f"🏦 SBI {symbol}: iNAV = ₹{inav}")
+                return inav
         except Exception as e:
             logger.warning(f"⚠️ SBI {symbol} failed: {str(e)}")
 
@@ -216,40 +459,28 @@ def scrape_uti_inav(driver, symbol):
     """Scrape from UTI MF nav-dividend page"""
     try:
         logger.info(f"🏛️ UTI: Attempting to scrape {symbol}...")
-        driver.get("https://www.utimf.com/mutual-funds/nav-dividend")
-        time.sleep(5)
+        driver.get(UTI_INAV_URL)
 
         try:
-            # Direct ID lookup
-            gold_etf_cell = driver.find_element(By.ID, "myDiv9")
-            row = gold_etf_cell.find_element(By.XPATH, "..")
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) >= 2:
-                inav_text = cells[1].text.strip()
-                inav_text = inav_text.replace('₹', '').replace(',', '').strip()
-                inav = safe_float(inav_text)
-                if inav > 0:
-                    logger.info(f"🏛️ UTI {symbol}: iNAV = ₹{inav}")
-                    return inav
+            # Direct ID lookup (row holding #myDiv9) - a timeout drops to the fallback
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "myDiv9")))
+            inav_text = extract_table_cell(driver, "tr:has(#myDiv9)", "", 1)
+            if inav_text is None:
+                raise ValueError("myDiv9 row not found")
+            inav = safe_float(inav_text.replace('₹', '').replace(',', ''))
+            if inav > 0:
+                logger.info(f"🏛️ UTI {symbol}: iNAV = ₹{inav}")
+                return inav
         except Exception as e:
             logger.warning(f"⚠️ UTI {symbol}: Direct ID lookup failed, trying fallback...")
 
             # Fallback method
-            rows = driver.find_elements(By.TAG_NAME, "tr")
-            for row in rows:
-                try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if len(cells) >= 2:
-                        name_cell = cells[0].text.strip().lower()
-                        if "gold exchange traded fund" in name_cell or "gold etf" in name_cell:
-                            inav_text = cells[1].text.strip()
-                            inav_text = inav_text.replace('₹', '').replace(',', '').strip()
-                            inav = safe_float(inav_text)
-                            if inav > 0:
-                                logger.info(f"🏛️ UTI {symbol}: iNAV = ₹{inav} (fallback)")
-                                return inav
-                except:
-                    continue
+            for name in ["gold exchange traded fund", "gold etf"]:
+                inav_text = extract_table_cell(driver, "tr", name, 1, match_index=0)
+                inav = safe_float((inav_text or '').replace('₹', '').replace(',', ''))
+                if inav > 0:
+                    logger.info(f"🏛️ UTI {symbol}: iNAV = ₹{inav} (fallback)")
+                    return inav
 
         logger.warning(f"⚠️ UTI {symbol}: Could not find iNAV")
         return 0.0
@@ -261,21 +492,26 @@ def scrape_hdfc_inav(driver, symbol):
     """Scrape from HDFC MF website"""
     try:
         logger.info(f"🏦 HDFC: Attempting to scrape {symbol}...")
-        driver.get("https://www.hdfcfund.com/explore/mutual-funds/hdfc-silver-etf/regular")
+        driver.get(HDFC_INAV_URL)
 
         try:
             WebDriverWait(driver, 15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "p.style_description__kIUXb"))
             )
-            time.sleep(10)
         except TimeoutException:
             logger.warning(f"⚠️ HDFC {symbol}: Timeout waiting for iNAV element")
             return 0.0
 
+        # Value is filled in by JS after the element appears - wait for the ₹ text itself
+        try:
+            WebDriverWait(driver, 10).until(
+                lambda d: any('₹' in t for t in d.execute_script(_ELEMENT_TEXTS_JS, "p.style_description__kIUXb") or [])
+            )
+        except TimeoutException:
+            logger.warning(f"⚠️ HDFC {symbol}: iNAV value not rendered, trying regex fallback...")
+
         try:
-            inav_elements = driver.find_elements(By.CSS_SELECTOR, "p.style_description__kIUXb")
-            for elem in inav_elements:
-                text = elem.text.strip()
+            for text in driver.execute_script(_ELEMENT_TEXTS_JS, "p.style_description__kIUXb") or []:
                 if '₹' in text:
                     inav_text = text.replace('₹', '').replace(',', '').strip()
                     inav = safe_float(inav_text)
@@ -288,7 +524,7 @@ def scrape_hdfc_inav(driver, symbol):
         # Fallback: Regex search
         try:
             page_source = driver.page_source
-            match = re.search(r'iNAV.*?₹\s*([0-9]{2,3}\.[0-9]{2})', page_source, re.IGNORECASE | re.DOTALL)
+            match = _INAV_HDFC_RE.search(page_source)
             if match:
                 inav = safe_float(match.group(1))
                 if 100 < inav < 200:
@@ -307,35 +543,22 @@ def scrape_etfjunction_inav(driver, symbol):
     """Scrape from ETF Junction DataTable"""
     try:
         logger.info(f"📊 ETFJunction: Attempting to scrape {symbol}...")
-        driver.get("https://etfjunction.com/inav.php")
+        driver.get(ETFJUNCTION_INAV_URL)
 
         try:
             WebDriverWait(driver, 25).until(EC.presence_of_element_located((By.CLASS_NAME, "etftable_ab")))
-            table = driver.find_element(By.CLASS_NAME, "etftable_ab")
             logger.info(f"📊 ETFJunction {symbol}: Table loaded successfully")
         except TimeoutException:
-            logger.warning(f"⚠️ ETFJunction {symbol}: Table failed to load within 15s")
+            logger.warning(f"⚠️ ETFJunction {symbol}: Table failed to load within 25s")
             return 0.0
 
-        time.sleep(2)
-
         try:
-            table = driver.find_element(By.CLASS_NAME, "etftable_ab")
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            logger.info(f"📊 ETFJunction {symbol}: Found {len(rows)} rows in table")
-
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 4:
-                    exchange_symbol = cells[1].text.strip()
-                    if exchange_symbol == symbol:
-                        inav_text = cells[3].text.strip()
-                        inav = safe_float(inav_text)
-                        if inav > 0:
-                            logger.info(f"📊 ETFJunction {symbol}: iNAV = ₹{inav}")
-                            return inav
-
-            logger.warning(f"⚠️ ETFJunction {symbol}: Symbol not found in {len(rows)} rows")
+            inav = safe_float(extract_table_cell(driver, ".etftable_ab tr", symbol, 3, match_index=1, exact=True))
+            if inav > 0:
+                logger.info(f"📊 ETFJunction {symbol}: iNAV = ₹{inav}")
+                return inav
+
+            logger.warning(f"⚠️ ETFJunction {symbol}: Symbol not found in table")
             return 0.0
         except Exception as e:
             logger.warning(f"⚠️ ETFJunction {symbol}: Table parsing failed - {str(e)}")
@@ -344,90 +567,432 @@ def scrape_etfjunction_inav(driver, symbol):
         logger.error(f"❌ ETFJunction {symbol} scraping failed: {str(e)}")
         return 0.0
 
-# ============================================================================
-# CHROME DRIVER SETUP
-# ============================================================================
+# url -> (rendered_at, page_source) of AMC pages already loaded in Chrome
+_rendered_pages = {}
+_rendered_page_locks = {url: threading.Lock() for url, _ in AMC_PAGES.values()}
 
-def create_optimized_driver():
+# symbol -> Chrome scraper for its AMC page (same keys as AMC_PAGES)
+AMC_SELENIUM_SCRAPERS = {
+    'BSLGOLDETF': scrape_etfjunction_inav,
+    'SILVER': scrape_etfjunction_inav,
+    'SETFGOLD': scrape_sbi_inav,
+    'SBISILVER': scrape_sbi_inav,
+    'GOLDSHARE': scrape_uti_inav,
+    'HDFCSILVER': scrape_hdfc_inav,
+}
+
+def scrape_amc_inav_selenium(symbol, driver=None):
     """
-    Create headless Chrome driver with optimized settings
-    Optimized for Intel i3-6006U (dual-core) with 8GB RAM
+    Scrape AMC iNAV with a pooled Chrome driver (JS-rendered pages)
+    The rendered page is kept for AMC_PAGE_TTL so a second fund on it needs no reload.
+    A caller that already holds a driver can pass it in instead of taking another.
     """
-    chrome_options = Options()
+    if symbol not in AMC_PAGES:
+        return 0.0
 
+    url, parser = AMC_PAGES[symbol]
+    with _rendered_page_locks[url]:
+        rendered = _rendered_pages.get(url)
+        if rendered and (time.time() - rendered[0]) < AMC_PAGE_TTL:
+            inav = parser(lxml_html.fromstring(rendered[1]), symbol)
+            if inav > 0:
+                return inav
+
+        amc_driver = driver or acquire_driver()
+        try:
+            inav = AMC_SELENIUM_SCRAPERS[symbol](amc_driver, symbol)
+
+            if inav > 0:
+                try:
+                    _rendered_pages[url] = (time.time(), amc_driver.page_source)
+                except Exception:
+                    pass
+            return inav
+        finally:
+            if driver is None:
+                release_driver(amc_driver)
+
+# ============================================================================
+# CHROME DRIVER SETUP
+# ============================================================================
+
+# Built once at import - create_optimized_driver only copies these into Options()
+_CHROME_ARGS = (
     # ═══════════════════════════════════════════════════════════════
     # EXISTING FLAGS (KEEP THESE)
     # ═══════════════════════════════════════════════════════════════
-    chrome_options.add_argument('--headless=new')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--disable-software-rasterizer')
-    chrome_options.add_argument('--disable-extensions')
-    chrome_options.add_argument('--log-level=3')
-    chrome_options.add_argument('--silent')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    '--headless=new',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-software-rasterizer',
+    '--disable-extensions',
+    '--log-level=3',
+    '--silent',
+    '--window-size=1920,1080',
+    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
 
     # ═══════════════════════════════════════════════════════════════
-    # NEW MEMORY-SAVING FLAGS (ADD THESE)
+    # MEMORY-SAVING FLAGS
     # ═══════════════════════════════════════════════════════════════
     # Disable unnecessary background processes
-    chrome_options.add_argument('--disable-background-networking')
-    chrome_options.add_argument('--disable-default-apps')
-    chrome_options.add_argument('--disable-sync')
-    chrome_options.add_argument('--disable-background-timer-throttling')
-    chrome_options.add_argument('--disable-backgrounding-occluded-windows')
-    chrome_options.add_argument('--disable-renderer-backgrounding')
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
 
     # Disable media & audio (not needed for scraping)
-    chrome_options.add_argument('--mute-audio')
+    '--mute-audio',
 
     # Disable DevTools overhead
-    chrome_options.add_argument('--disable-dev-tools')
+    '--disable-dev-tools',
 
     # Reduce telemetry
-    chrome_options.add_argument('--metrics-recording-only')
-    chrome_options.add_argument('--no-first-run')
+    '--metrics-recording-only',
+    '--no-first-run',
 
     # ⭐ CRITICAL: Memory pressure management for 8GB RAM
-    chrome_options.add_argument('--memory-pressure-off')
+    '--memory-pressure-off',
 
     # ⭐ CRITICAL: Limit V8 JavaScript heap size (prevents OOM)
-    chrome_options.add_argument('--max-old-space-size=512')  # 512 MB limit
+    '--max-old-space-size=512',  # 512 MB limit
 
     # Additional GPU optimizations
-    chrome_options.add_argument('--disable-accelerated-2d-canvas')
-    chrome_options.add_argument('--disable-webgl')
+    '--disable-accelerated-2d-canvas',
+    '--disable-webgl',
 
-    # ═══════════════════════════════════════════════════════════════
-    # PREFERENCES (UPDATED)
-    # ═══════════════════════════════════════════════════════════════
-    prefs = {
-        'profile.default_content_setting_values': {
-            'images': 2,        # Block images (already there)
-            'javascript': 1,    # Allow JavaScript (needed for dynamic content)
-            'notifications': 2, # Block notifications ⭐ NEW
-            'media_stream': 2,  # Block media streams (camera/mic) ⭐ NEW
-        }
-    }
-    chrome_options.add_experimental_option('prefs', prefs)
-    chrome_options.page_load_strategy = 'eager'  # Already there, keep it!
+    # Don't decode images even if a request slips past the CDP block list
+    '--blink-settings=imagesEnabled=false',
+)
+
+# ═══════════════════════════════════════════════════════════════
+# PREFERENCES
+# ═══════════════════════════════════════════════════════════════
+_CHROME_PREFS = {
+    'profile.default_content_setting_values': {
+        'images': 2,        # Block images
+        'javascript': 1,    # Allow JavaScript (needed for dynamic content)
+        'notifications': 2, # Block notifications
+        'media_stream': 2,  # Block media streams (camera/mic)
+    },
+    # Only a few text cells are read - skip images, CSS, fonts and plugins
+    'profile.managed_default_content_settings.images': 2,
+    'profile.managed_default_content_settings.stylesheets': 2,
+    'profile.managed_default_content_settings.fonts': 2,
+    'profile.managed_default_content_settings.plugins': 2,
+}
+
+# Resource types never needed for text scraping - blocked at the network layer via CDP
+_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.css',
+    '*.mp4', '*.webm',
+]
+
+def create_optimized_driver():
+    """
+    Create headless Chrome driver with optimized settings
+    Optimized for Intel i3-6006U (dual-core) with 8GB RAM
+    """
+    chrome_options = Options()
+    for arg in _CHROME_ARGS:
+        chrome_options.add_argument(arg)
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    chrome_options.add_experimental_option('prefs', _CHROME_PREFS)
+    chrome_options.page_load_strategy = 'eager'
 
-    # ═══════════════════════════════════════════════════════════════
-    # CREATE DRIVER (SAME AS BEFORE)
-    # ═══════════════════════════════════════════════════════════════
     driver = webdriver.Chrome(options=chrome_options)
     driver.set_page_load_timeout(15)
-    driver.implicitly_wait(2)
+    # No implicit wait: it compounds with the explicit WebDriverWaits and
+    # silently delays every missing-element lookup
+    driver.implicitly_wait(0)
+
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning(f"⚠️ Could not enable CDP resource blocking: {str(e)[:100]}")
 
     return driver
 
 # ============================================================================
-# CORE SCRAPING FUNCTIONS
+# CHROME DRIVER POOL (KEEPS DRIVERS WARM ACROSS SCRAPES)
+# ============================================================================
+
+DRIVER_POOL_SIZE = 2  # One per core on the dual-core i3
+_DRIVER_POOL = queue.Queue(maxsize=DRIVER_POOL_SIZE)
+
+def acquire_driver():
+    """Get a warm driver from the pool, or start a new one if none is idle"""
+    try:
+        return _DRIVER_POOL.get_nowait()
+    except queue.Empty:
+        return create_optimized_driver()
+
+def release_driver(driver):
+    """Reset a driver and return it to the pool (quit it if the pool is full or it is broken)"""
+    try:
+        driver.delete_all_cookies()
+        driver.get('about:blank')  # Frees the renderer's page memory
+        _DRIVER_POOL.put_nowait(driver)
+    except Exception:
+        try:
+            driver.quit()
+        except:
+            pass
+
+def shutdown_driver_pool():
+    """Quit every pooled driver (registered with atexit)"""
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            driver.quit()
+        except:
+            pass
+
+atexit.register(shutdown_driver_pool)
+
+# ============================================================================
+# AMC iNAV DISPATCH
+# ============================================================================
+
+AMC_HTTP_WORKERS = 8
+
+def scrape_amc_inav(symbol, driver=None):
+    """AMC iNAV for one symbol: plain HTTP first, pooled (or caller's) Chrome only if needed"""
+    # Static HTML first - only boot Chrome for JS-rendered pages
+    inav = scrape_amc_inav_http(symbol)
+    if inav == 0:
+        inav = scrape_amc_inav_selenium(symbol, driver)
+    return inav
+
+def _collect_inavs(executor, fn, symbols, results):
+    """Run fn(symbol) for each symbol on executor, storing results as they finish"""
+    _gather_inavs({executor.submit(fn, symbol): symbol for symbol in symbols}, results)
+
+def _gather_inavs(futures, results):
+    """Store the result of each {future: symbol} in results as it finishes"""
+    for future in as_completed(futures):
+        symbol = futures[future]
+        try:
+            results[symbol] = future.result()
+        except Exception as e:
+            logger.warning(f"⚠️ {symbol}: AMC scraping failed: {str(e)}")
+            results[symbol] = 0.0
+
+def fetch_all_inavs(symbols, http_results=None):
+    """
+    Fetch AMC iNAVs for several symbols in parallel
+    Stage 1: requests-based sources on a wide HTTP pool (keep-alive session)
+    Stage 2: Chrome fallback for the misses, one worker per pooled driver
+    http_results holds stage-1 results the caller already fetched (those symbols skip stage 1)
+    """
+    results = dict(http_results or {})
+    if not symbols:
+        return results
+
+    http_symbols = [s for s in symbols if s not in results]
+    if http_symbols:
+        with ThreadPoolExecutor(max_workers=AMC_HTTP_WORKERS) as http_pool:
+            _collect_inavs(http_pool, scrape_amc_inav_http, http_symbols, results)
+
+    selenium_symbols = [s for s in symbols if results.get(s, 0) == 0 and s != "GOLD360"]
+    if selenium_symbols:
+        with ThreadPoolExecutor(max_workers=DRIVER_POOL_SIZE) as amc_pool:
+            _collect_inavs(amc_pool, scrape_amc_inav_selenium, selenium_symbols, results)
+
+    for symbol in symbols:
+        if results.get(symbol, 0) > 0:
+            logger.info(f"✅ {symbol}: Got iNAV from AMC = ₹{results[symbol]}")
+    return results
+
+# ============================================================================
+# NSE QUOTE API (HTTP - NO CHROME)
+# ============================================================================
+
+NSE_BASE_URL = "https://www.nseindia.com"
+NSE_QUOTE_API = f"{NSE_BASE_URL}/api/quote-equity"
+NSE_HTTP_WORKERS = 8  # Matches the session's pool_maxsize
+NSE_QUOTE_TTL = 30  # seconds - long enough to span the static and dynamic passes of one run
+NSE_SEED_TIMEOUT = (3, 10)  # (connect, read) - an unreachable NSE fails fast
+
+_NSE_SESSION = requests.Session()
+# Home page (cookie seed): no connect retries, so a blocked runner IP costs one short timeout
+_NSE_SESSION.mount(NSE_BASE_URL, HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(total=2, connect=0, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+))
+_NSE_SESSION.mount(f"{NSE_BASE_URL}/api/", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+))
+_NSE_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate',
+    'Referer': f"{NSE_BASE_URL}/get-quotes/equity",
+})
+_nse_cookie_lock = threading.Lock()
+# 'down': circuit breaker - set on the first connection error / timeout, then every
+# remaining symbol skips the API and goes straight to the Selenium fallback
+_nse_state = {'seeded': False, 'down': False}
+
+def _seed_nse_cookies(force=False):
+    """
+    GET the NSE home page once so the API accepts our requests (nsit / nseappid cookies)
+    Returns False once NSE has been found unreachable this run.
+    """
+    with _nse_cookie_lock:
+        if _nse_state['down']:
+            return False
+        if _nse_state['seeded'] and not force:
+            return True
+        try:
+            _NSE_SESSION.get(NSE_BASE_URL, timeout=NSE_SEED_TIMEOUT)
+        except (requests.ConnectionError, requests.Timeout):
+            _nse_state['down'] = True  # Set under the lock so queued workers don't retry the seed
+            raise
+        _nse_state['seeded'] = True
+        return True
+
+def fetch_nse_quote(symbol, section=None):
+    """NSE quote-equity JSON for symbol (None on failure, or at once if NSE is down this run)"""
+    if _nse_state['down']:
+        return None
+    return _fetch_nse_quote_cached((symbol, section))
+
+@cached_ttl(seconds=NSE_QUOTE_TTL)
+def _fetch_nse_quote_cached(key):
+    """
+    Memoized quote fetch keyed by (symbol, section)
+    The static and dynamic passes read the same quote, so it is fetched and parsed once.
+    """
+    symbol, section = key
+    params = {'symbol': symbol}
+    if section:
+        params['section'] = section
+    try:
+        if not _seed_nse_cookies():
+            return None
+        response = _NSE_SESSION.get(NSE_QUOTE_API, params=params, timeout=10)
+        if response.status_code in (401, 403):
+            # Cookies expired - re-seed once
+            _seed_nse_cookies(force=True)
+            response = _NSE_SESSION.get(NSE_QUOTE_API, params=params, timeout=10)
+        response.raise_for_status()
+        return response.json()
+    except (requests.ConnectionError, requests.Timeout) as e:
+        _nse_state['down'] = True
+        logger.warning(f"⚠️ {symbol}: NSE unreachable, skipping the API for this run - {str(e)[:100]}")
+        return None
+    except Exception as e:
+        logger.warning(f"⚠️ {symbol}: NSE API failed - {str(e)[:100]}")
+        return None
+
+def fetch_nse_static_fields(symbol):
+    """STATIC fields from the NSE quote API: prevClose, open, week52High, week52HighDate, vwap"""
+    quote = fetch_nse_quote(symbol)
+    if not quote:
+        return None
+
+    price_info = quote.get('priceInfo') or {}
+    week_high_low = price_info.get('weekHighLow') or {}
+    prev_close = safe_float(price_info.get('previousClose'))
+    if prev_close <= 0:
+        return None
+
+    logger.info(f"✅ {symbol}: Static fields via NSE API")
+    return {
+        'symbol': symbol,
+        'prevClose': round(prev_close, 2),
+        'open': round(safe_float(price_info.get('open')), 2),
+        'week52High': round(safe_float(week_high_low.get('max')), 2),
+        'week52HighDate': str(week_high_low.get('maxDate') or '').strip(),
+        'vwap': round(safe_float(price_info.get('vwap')), 2)
+    }
+
+def fetch_all_nse_static_fields(symbols):
+    """
+    STATIC fields for several symbols, fanned out over the NSE session's pool
+    Returns {symbol: fields}; symbols the API could not serve are left out.
+    """
+    results = {}
+    if not symbols:
+        return results
+
+    with ThreadPoolExecutor(max_workers=NSE_HTTP_WORKERS) as nse_pool:
+        futures = {nse_pool.submit(fetch_nse_static_fields, symbol): symbol for symbol in symbols}
+        for future in as_completed(futures):
+            try:
+                static = future.result()
+            except Exception as e:
+                logger.warning(f"⚠️ {futures[future]}: NSE static fetch failed - {str(e)[:100]}")
+                continue
+            if static:
+                results[futures[future]] = static
+    return results
+
+def fetch_nse_dynamic_fields(symbol):
+    """DYNAMIC fields from the NSE quote API: price, dayHigh, dayLow, deliveryPercent, inav, volume"""
+    quote = fetch_nse_quote(symbol)
+    if not quote:
+        return None
+
+    price_info = quote.get('priceInfo') or {}
+    price = safe_float(price_info.get('lastPrice'))
+    if price <= 0:
+        return None
+
+    # Volume / delivery live in the trade_info section - without it, leave the symbol to Selenium
+    trade = fetch_nse_quote(symbol, section='trade_info')
+    if not trade:
+        return None
+    trade_info = (trade.get('marketDeptOrderBook') or {}).get('tradeInfo') or {}
+    delivery = trade.get('securityWiseDP') or {}
+    intraday = price_info.get('intraDayHighLow') or {}
+    inav = safe_float(price_info.get('iNavValue') or (quote.get('securityInfo') or {}).get('iNavValue'))
+
+    logger.info(f"✅ {symbol}: Dynamic fields via NSE API")
+    return {
+        'symbol': symbol,
+        'price': round(price, 2),
+        'dayHigh': round(safe_float(intraday.get('max')), 2),
+        'dayLow': round(safe_float(intraday.get('min')), 2),
+        'deliveryPercent': round(safe_float(delivery.get('deliveryToTradedQuantity')), 2),
+        'inav': round(inav, 2),
+        'volume': int(safe_float(trade_info.get('totalTradedVolume')) * 100000)  # Lakhs -> units
+    }
+
+# ============================================================================
+# CORE SCRAPING FUNCTIONS (SELENIUM FALLBACK)
 # ============================================================================
 
+NSE_QUOTE_FIELD_IDS = [
+    'quoteLtp', 'iNavValue', 'stockPreviousClose', 'stockOpenPrice', 'stockHigh', 'stockLow',
+    'orderBookTradeVol', 'week52highVal', 'week52HighDate', 'orderBookDeliveryTradedQty'
+]
+
+# One round-trip for every quote field: {id: textContent or null}
+_NSE_FIELDS_JS = """
+return Object.fromEntries(arguments[0].map(id => {
+    const el = document.getElementById(id);
+    return [id, el ? el.textContent.trim() : null];
+}));
+"""
+
+def read_nse_quote_fields(driver):
+    """Read all NSE quote-page fields in a single execute_script call"""
+    return driver.execute_script(_NSE_FIELDS_JS, NSE_QUOTE_FIELD_IDS) or {}
+
 
 def scrape_static_fields(driver, symbol, isin=""):
     """Scrape STATIC fields only: prevClose, open, week52High, week52HighDate, vwap"""
@@ -435,70 +1000,63 @@ def scrape_static_fields(driver, symbol, isin=""):
         url = f"https://www.nseindia.com/get-quotes/equity?symbol={symbol}"
         driver.get(url)
         WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.ID, 'quoteLtp')))
-        time.sleep(2)
+        fields = read_nse_quote_fields(driver)
         logger.error(f"✅ {symbol}: Static scraping done")
         return {
             'symbol': symbol,
-            'prevClose': round(safe_float(driver.find_element(By.ID, 'stockPreviousClose').text), 2),
-            'open': round(safe_float(driver.find_element(By.ID, 'stockOpenPrice').text), 2),
-            'week52High': round(safe_float(driver.find_element(By.ID, 'week52highVal').text), 2),
-            'week52HighDate': driver.find_element(By.ID, 'week52HighDate').text.strip().replace('(', '').replace(')', ''),
-            'vwap': round(safe_float(driver.find_element(By.ID, 'quoteLtp').text), 2)
+            'prevClose': round(safe_float(fields.get('stockPreviousClose')), 2),
+            'open': round(safe_float(fields.get('stockOpenPrice')), 2),
+            'week52High': round(safe_float(fields.get('week52highVal')), 2),
+            'week52HighDate': (fields.get('week52HighDate') or '').strip().replace('(', '').replace(')', ''),
+            'vwap': round(safe_float(fields.get('quoteLtp')), 2)
         }
         
     except Exception as e:
         logger.error(f"❌ {symbol}: Static scraping failed")
         return None
 
-def scrape_dynamic_fields(driver, symbol, isin="", retry_count=0):
+def scrape_dynamic_fields(driver, symbol, isin="", *, max_retries=2, amc_fallback=True):
     """Scrape DYNAMIC fields: price, dayHigh, dayLow, deliveryPercent, inav, volume"""
-    max_retries = 2
+    url = f"https://www.nseindia.com/get-quotes/equity?symbol={symbol}"
+    loaded = False
+    fields = {}
+    price = 0.0
     try:
-        url = f"https://www.nseindia.com/get-quotes/equity?symbol={symbol}"
-        driver.get(url)
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.ID, 'quoteLtp')))
-        time.sleep(2)
-        logger.error(f"✅ {symbol}: Dynamic scraping done")
-        price = safe_float(driver.find_element(By.ID, 'quoteLtp').text)
+        for attempt in range(max_retries + 1):
+            if attempt:
+                time.sleep(min(0.25 * 2 ** attempt, 2.0))  # Exponential backoff, capped at 2s
+            try:
+                # Only reload when the page itself failed - an empty read just re-reads
+                if not loaded:
+                    driver.get(url)
+                    WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.ID, 'quoteLtp')))
+                    loaded = True
+                    try:
+                        # Trade info renders after the quote header - wait for it specifically
+                        WebDriverWait(driver, 5).until(EC.text_to_be_present_in_element((By.ID, 'orderBookTradeVol'), '.'))
+                    except TimeoutException:
+                        pass
+                fields = read_nse_quote_fields(driver)
+                price = safe_float(fields.get('quoteLtp'))
+                if price > 0:
+                    break
+            except WebDriverException as e:
+                loaded = False
+                logger.warning(f"⚠️ {symbol}: NSE page attempt {attempt + 1} failed - {str(e)[:100]}")
+
         if price <= 0:
-            if retry_count < max_retries:
-                return scrape_dynamic_fields(driver, symbol, isin, retry_count + 1)
             return None
+        logger.error(f"✅ {symbol}: Dynamic scraping done")
         
         # NSE iNAV
-        inav = 0.0
-        try:
-            inav = safe_float(driver.find_element(By.ID, 'iNavValue').text)
-        except:
-            pass
+        inav = safe_float(fields.get('iNavValue'))
         
-        # AMC Fallback (COPY YOUR EXISTING AMC LOGIC HERE)
-        if inav == 0:
+        # AMC Fallback (skipped when the caller batches AMC lookups itself)
+        if inav == 0 and amc_fallback:
             try:
                 logger.info(f"🌐 {symbol}: Trying AMC for iNAV...")
-                if symbol == "GOLD360":
-                    inav = scrape_360one_inav(symbol)
-                elif symbol in ["BSLGOLDETF", "SILVER"]:
-                    etfj_driver = create_optimized_driver()
-                    try:
-                        inav = scrape_etfjunction_inav(etfj_driver, symbol)
-                    finally:
-                        etfj_driver.quit()
-                # Add other AMC logic here...
-                else:  # ← ADD THIS BLOCK!
-                    amc_driver = create_optimized_driver()
-                    try:
-                        if symbol == "SETFGOLD":
-                            inav = scrape_sbi_inav(amc_driver, symbol)
-                        elif symbol == "SBISILVER":
-                            inav = scrape_sbi_inav(amc_driver, symbol)
-                        elif symbol == "GOLDSHARE":  # ← FIXES GOLDSHARE!
-                            inav = scrape_uti_inav(amc_driver, symbol)
-                        elif symbol == "HDFCSILVER":  # ← FIXES HDFCSILVER!
-                            inav = scrape_hdfc_inav(amc_driver, symbol)
-                    finally:
-                        amc_driver.quit()
-                    
+                # NSE fields are already read, so the same driver can load the AMC page
+                inav = scrape_amc_inav(symbol, driver)
                 if inav > 0:
                     logger.info(f"✅ {symbol}: Got iNAV from AMC = ₹{inav}")
             
@@ -509,142 +1067,206 @@ def scrape_dynamic_fields(driver, symbol, isin="", retry_count=0):
         return {
             'symbol': symbol,
             'price': round(price, 2),
-            'dayHigh': round(safe_float(driver.find_element(By.ID, 'stockHigh').text), 2),
-            'dayLow': round(safe_float(driver.find_element(By.ID, 'stockLow').text), 2),
-            'deliveryPercent': round(safe_float(driver.find_element(By.ID, 'orderBookDeliveryTradedQty').text.replace('%', '')), 2),
+            'dayHigh': round(safe_float(fields.get('stockHigh')), 2),
+            'dayLow': round(safe_float(fields.get('stockLow')), 2),
+            'deliveryPercent': round(safe_float((fields.get('orderBookDeliveryTradedQty') or '').replace('%', '')), 2),
             'inav': round(inav, 2),
-            'volume': int(safe_float(driver.find_element(By.ID, 'orderBookTradeVol').text) * 100000)
+            'volume': int(safe_float(fields.get('orderBookTradeVol')) * 100000)
         }
     except Exception as e:
-        if retry_count < max_retries:
-            return scrape_dynamic_fields(driver, symbol, isin, retry_count + 1)
+        logger.error(f"❌ {symbol}: Dynamic scraping failed - {str(e)[:100]}")
         return None
 
 
 def calculate_mcx_fields(etf, mcx_gold, mcx_silver):
     """Calculate effective price per gram and IBJA comparison (FIXED)"""
-    
-    # Determine metal type
-    etf_type = etf.get('type', '')
-    metal_per_unit = float(etf.get('gold_per_unit', 0)) if etf_type == 'gold' else float(etf.get('silver_per_unit', 0))
-    price = float(etf.get('price', 0))
-    
+    return calculate_mcx_fields_batch([etf], mcx_gold, mcx_silver)[0]
+
+def calculate_mcx_fields_batch(etfs, mcx_gold, mcx_silver):
+    """
+    calculate_mcx_fields for a list of ETF dicts in one vectorized pass (updated in place)
+    Type and metal-per-unit come from each dict, so symbols outside ETF_LIST work too.
+    """
+    if not etfs:
+        return etfs
+
+    # Structure-of-arrays view of the scraped ETFs
+    count = len(etfs)
+    prices = np.fromiter((float(etf.get('price', 0)) for etf in etfs), dtype=np.float64, count=count)
+    is_gold = np.fromiter((etf.get('type', '') == 'gold' for etf in etfs), dtype=bool, count=count)
+    metal_per_unit = np.fromiter(
+        (float(etf.get('gold_per_unit' if gold else 'silver_per_unit', 0)) for etf, gold in zip(etfs, is_gold)),
+        dtype=np.float64, count=count
+    )
+
     # Get correct IBJA spot price
-    ibja_spot = mcx_gold if etf_type == 'gold' else mcx_silver
-    if (ibja_spot>0):
-        # Calculate effective price per gram
-        #logger.info(f"{etf.get('symbol', '')} : {metal_per_unit} ")
-        effective_price = (price / metal_per_unit) if metal_per_unit > 0 else 0
-        
-        # Calculate premium/discount vs IBJA
-        vs_ibja = ((effective_price - ibja_spot) / ibja_spot) * 100
-        #logger.info(f"{etf.get('symbol', '')} : {vs_ibja} ")
-        
-        # Add to ETF dict
-        etf['effective_price_per_gram'] = round(effective_price, 2)
-        etf['mcx_spot_per_gram'] = round(ibja_spot, 2)
-        etf['discount_vs_mcx'] = round(vs_ibja, 2)
-    else:
-        effective_price=0
-        vs_ibja=0
-        etf['effective_price_per_gram'] = round(effective_price, 2)
-        etf['mcx_spot_per_gram'] = round(ibja_spot, 2)
-        etf['discount_vs_mcx'] = round(vs_ibja, 2)
-    #logger.info(f"🔍 {etf.get('symbol', '')}: SAVED effective={etf['effective_price_per_gram']}, vs_ibja={etf['discount_vs_mcx']}")
-    return etf
+    ibja_spot = np.where(is_gold, mcx_gold, mcx_silver).astype(np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Effective price per gram, and premium/discount vs IBJA (both 0 without a spot price)
+        effective_price = np.where((metal_per_unit > 0) & (ibja_spot > 0), prices / metal_per_unit, 0.0)
+        vs_ibja = np.where(ibja_spot > 0, (effective_price - ibja_spot) / ibja_spot * 100, 0.0)
+
+    for etf, effective, spot, discount in zip(etfs,
+                                              np.round(effective_price, 2).tolist(),
+                                              np.round(ibja_spot, 2).tolist(),
+                                              np.round(vs_ibja, 2).tolist()):
+        etf['effective_price_per_gram'] = effective
+        etf['mcx_spot_per_gram'] = spot
+        etf['discount_vs_mcx'] = discount
+    return etfs
 
 def scrape_all_etfs_parallel():
     """OPTIMIZED TWO-TIER scraping with IBJA integration"""
     logger.info("⚡ Starting OPTIMIZED scraping with IBJA integration...")
     start_time = time.time()
+    now = datetime.now()  # One clock read for window routing, session date and timestamps
     
-    # Get IBJA prices
-    mcx_prices = get_mcx_spot_prices()
-    if mcx_prices is None:
-        logger.error("❌ MCX prices is None, using fallback")
-        mcx_prices = {
-            'gold_per_gram': 0.0,
-            'silver_per_gram': 0.0,
-            'timestamp': datetime.now().isoformat(),
-            'source': 'ERROR'
-        }
-    mcx_gold = mcx_prices.get('gold_per_gram', 0.0)
-    mcx_silver = mcx_prices.get('silver_per_gram', 0.0)
-    logger.info(f"💰 {mcx_prices.get('source')}: Gold=₹{mcx_gold:.2f}/g, Silver=₹{mcx_silver:.2f}/g")
+    # Get IBJA prices in the background - they are only needed once the NSE/AMC passes finish
+    mcx_pool = ThreadPoolExecutor(max_workers=1)
+    mcx_future = mcx_pool.submit(get_mcx_spot_prices, now)
+    mcx_pool.shutdown(wait=False)
     
-    # Load/check static cache
+    # Load/check static cache (only symbols not yet scraped this session)
     static_cache = load_static_cache()
-    needs_static_refresh = should_refresh_static_cache(static_cache)
+    trading_date = current_trading_date(now)
+    stale_symbols = stale_static_symbols(static_cache, trading_date)
     
-    # Scrape static if needed (SLOW, every 4 hours)
-    if needs_static_refresh:
-        logger.info("🏦 Scraping STATIC fields...")
-        driver = create_optimized_driver()
+    # Scrape static if needed (once per trading session)
+    if stale_symbols:
+        logger.info(f"🏦 Scraping STATIC fields for {len(stale_symbols)} ETFs (session {trading_date})...")
+        driver = None  # Chrome only started if the NSE API fails
         static_data_list = []
+        api_statics = fetch_all_nse_static_fields(stale_symbols)
         try:
-            for etf in ETF_LIST:
-                static = scrape_static_fields(driver, etf['symbol'], etf.get('isin', ''))
+            for symbol in stale_symbols:
+                static = api_statics.get(symbol)
+                if static is None:
+                    driver = driver or acquire_driver()
+                    static = scrape_static_fields(driver, symbol, ETF_BY_SYMBOL[symbol].get('isin', ''))
                 if static:
+                    static['trading_date'] = trading_date
+                    static['timestamp'] = now.isoformat()  # Only entries scraped in this pass
                     static_data_list.append(static)
-                time.sleep(1)
             if static_data_list:
-                save_static_cache(static_data_list)
-                static_cache = {s['symbol']: s for s in static_data_list}
+                static_cache = {**static_cache, **{s['symbol']: s for s in static_data_list}}
+                save_static_cache(list(static_cache.values()))
         finally:
-            driver.quit()
+            if driver:
+                release_driver(driver)
+    else:
+        logger.info(f"📦 Static fields current for session {trading_date}")
     
     # Scrape dynamic (FAST, every call)
     logger.info("⚡ Scraping DYNAMIC fields...")
-    driver = create_optimized_driver()
+    driver = None  # Chrome only started if the NSE API fails
+    dynamic_results = {}
     all_results = []
     success_count = 0
     
+    # AMC HTTP lookups start as soon as a symbol misses its NSE iNAV,
+    # overlapping with the rest of the NSE pass
+    amc_http_pool = ThreadPoolExecutor(max_workers=AMC_HTTP_WORKERS)
+    amc_futures = {}
+    amc_http_results = {}
+    def record_dynamic(symbol, dynamic):
+        if dynamic and dynamic.get('price', 0) > 0:
+            dynamic_results[symbol] = dynamic
+            if dynamic.get('inav', 0) == 0:
+                amc_futures[amc_http_pool.submit(scrape_amc_inav_http, symbol)] = symbol
+
+    nse_misses = []
     try:
-        for etf in ETF_LIST:
-            symbol = etf['symbol']
-            dynamic = scrape_dynamic_fields(driver, symbol, etf.get('isin', ''))
-            static = static_cache.get(symbol, {})
-            
-            if dynamic and dynamic.get('price', 0) > 0:
-                price = dynamic.get('price', 0)
-                prev_close = safe_float(static.get('prevClose', 0))
-                inav = dynamic.get('inav', 0)
-                
-                change = price - prev_close if prev_close > 0 else 0.0
-                change_percent = (change / prev_close * 100) if prev_close > 0 else 0.0
-                discount = ((price - inav) / inav * 100) if inav > 0 else 0.0
-                
-                combined = {
-                    **etf,
-                    **static,
-                    **dynamic,
-                    'change': round(change, 2),
-                    'changePercent': round(change_percent, 2),
-                    'discount': round(discount, 2),
-                    'gold_per_gram': mcx_gold,
-                    'silver_per_gram': mcx_silver,
-                    'status': 'live',
-                    'lastUpdate': datetime.now().isoformat(),
-                    'dataAge': 'live'
-                }
-                all_results.append(combined)
-                success_count += 1
-            time.sleep(0.5)
+        # NSE API for every ETF at once over the session's connection pool
+        with ThreadPoolExecutor(max_workers=NSE_HTTP_WORKERS) as nse_pool:
+            nse_futures = {nse_pool.submit(fetch_nse_dynamic_fields, etf['symbol']): etf for etf in ETF_LIST}
+            for future in as_completed(nse_futures):
+                etf = nse_futures[future]
+                try:
+                    dynamic = future.result()
+                except Exception as e:
+                    logger.warning(f"⚠️ {etf['symbol']}: NSE dynamic fetch failed - {str(e)[:100]}")
+                    dynamic = None
+                if dynamic is None:
+                    nse_misses.append(etf)
+                else:
+                    record_dynamic(etf['symbol'], dynamic)
+
+        # Chrome only for symbols the API could not serve (one shared driver)
+        for etf in nse_misses:
+            driver = driver or acquire_driver()
+            record_dynamic(etf['symbol'], scrape_dynamic_fields(driver, etf['symbol'], etf.get('isin', ''), amc_fallback=False))
+        _gather_inavs(amc_futures, amc_http_results)
     finally:
-        driver.quit()
+        amc_http_pool.shutdown(wait=False)
+        if driver:
+            release_driver(driver)
+    
+    # AMC fallback for missing NSE iNAVs (Chrome stage in parallel, one worker per pooled driver)
+    amc_misses = list(amc_futures.values())
+    if amc_misses:
+        logger.info(f"🌐 Trying AMC for iNAV: {', '.join(amc_misses)}")
+        for symbol, inav in fetch_all_inavs(amc_misses, amc_http_results).items():
+            dynamic_results[symbol]['inav'] = round(inav, 2)
+    
+    try:
+        mcx_prices = mcx_future.result()
+    except Exception as e:
+        logger.error(f"❌ MCX price fetch failed: {str(e)[:100]}")
+        mcx_prices = None
+    if mcx_prices is None:
+        logger.error("❌ MCX prices is None, using fallback")
+        mcx_prices = {
+            'gold_per_gram': 0.0,
+            'silver_per_gram': 0.0,
+            'timestamp': now.isoformat(),
+            'source': 'ERROR'
+        }
+    mcx_gold = mcx_prices.get('gold_per_gram', 0.0)
+    mcx_silver = mcx_prices.get('silver_per_gram', 0.0)
+    logger.info(f"💰 {mcx_prices.get('source')}: Gold=₹{mcx_gold:.2f}/g, Silver=₹{mcx_silver:.2f}/g")
+    
+    last_update = datetime.now().isoformat()  # After scraping, shared by every ETF
+    for etf in ETF_LIST:
+        symbol = etf['symbol']
+        dynamic = dynamic_results.get(symbol)
+        static = static_cache.get(symbol, {})
+        
+        if dynamic:
+            price = dynamic.get('price', 0)
+            prev_close = safe_float(static.get('prevClose', 0))
+            inav = dynamic.get('inav', 0)
+            
+            change = price - prev_close if prev_close > 0 else 0.0
+            change_percent = (change / prev_close * 100) if prev_close > 0 else 0.0
+            discount = ((price - inav) / inav * 100) if inav > 0 else 0.0
+            
+            # etf is the shared ETF_LIST entry - copy once, then update in place
+            combined = etf.copy()
+            combined.update(static)
+            combined.update(dynamic)
+            combined['change'] = round(change, 2)
+            combined['changePercent'] = round(change_percent, 2)
+            combined['discount'] = round(discount, 2)
+            combined['gold_per_gram'] = mcx_gold
+            combined['silver_per_gram'] = mcx_silver
+            combined['status'] = 'live'
+            combined['lastUpdate'] = last_update
+            combined['dataAge'] = 'live'
+            all_results.append(combined)
+            success_count += 1
     
     # Calculate IBJA fields
+    calculate_mcx_fields_batch(all_results, mcx_gold, mcx_silver)
+    gold_etfs, silver_etfs = [], []
     for etf in all_results:
-        calculate_mcx_fields(etf, mcx_gold, mcx_silver)
-    
-    gold_etfs = [e for e in all_results if e['type'] == 'gold']
-    silver_etfs = [e for e in all_results if e['type'] == 'silver']
+        (gold_etfs if etf['type'] == 'gold' else silver_etfs).append(etf)
     
     results = {
         'gold_etfs': gold_etfs,
         'silver_etfs': silver_etfs,
         'mcx_spot_prices': mcx_prices,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': last_update,
         'success_count': success_count,
         'total_count': len(ETF_LIST)
     }
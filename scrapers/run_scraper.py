@@ -1,80 +1,69 @@
 import sys
 import os
 import csv
-import json
+import itertools
 import logging
-import shutil
-from pathlib import Path
 from datetime import datetime
 
 sys.path.append('.')
 from scrapers.etf_scraper_mcx import scrape_all_etfs_parallel
+from scrapers.mcx_scraper import atomic_write, write_json_file
 
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+ETF_CACHE_FILE = 'data/etf_cache.csv'
+MCX_CACHE_FILE = 'data/mcx_cache.json'
+
 def save_etf_cache(results):
     """Save complete ETF data to etf_cache.csv"""
-    try:
-        gold_etfs = results.get('gold_etfs', [])
-        silver_etfs = results.get('silver_etfs', [])
-        all_etfs = gold_etfs + silver_etfs
-
-        if not all_etfs:
-            logger.warning("⚠️ No ETF data to save!")
-            return
-
-        os.makedirs('data', exist_ok=True)
+    gold_etfs = results.get('gold_etfs', [])
+    silver_etfs = results.get('silver_etfs', [])
+    etf_count = len(gold_etfs) + len(silver_etfs)
 
-        fieldnames = set()
-        for etf in all_etfs:
-            fieldnames.update(etf.keys())
-        fieldnames = sorted(list(fieldnames))
+    if not etf_count:
+        logger.warning("⚠️ No ETF data to save!")
+        return
 
-        with open('data/etf_cache.csv', 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(all_etfs)
+    # Union of keys in first-seen order: gold rows carry gold_per_unit, silver rows
+    # silver_per_unit (frontend reads columns by header name, so order is free)
+    fieldnames = list(dict.fromkeys(
+        key for etf in itertools.chain(gold_etfs, silver_etfs) for key in etf
+    ))
 
-        logger.info(f"✅ Saved {len(all_etfs)} ETFs to data/etf_cache.csv")
-        logger.info(f"   Gold: {len(gold_etfs)}, Silver: {len(silver_etfs)}")
-
-    except Exception as e:
+    try:
+        os.makedirs('data', exist_ok=True)
+        with atomic_write(ETF_CACHE_FILE, newline='', encoding='utf-8') as f:
+            # Plain rows: no per-field dict checks inside DictWriter
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                [etf.get(key, '') for key in fieldnames]
+                for etf in itertools.chain(gold_etfs, silver_etfs)
+            )
+    except OSError as e:
         logger.error(f"❌ Failed to save etf_cache.csv: {e}")
+        return
+
+    logger.info(f"✅ Saved {etf_count} ETFs to {ETF_CACHE_FILE}")
+    logger.info(f"   Gold: {len(gold_etfs)}, Silver: {len(silver_etfs)}")
 
 def save_mcx_cache(results):
     """Save MCX spot prices to mcx_cache.json"""
-    try:
-        mcx_prices = results.get('mcx_spot_prices', {})
+    mcx_prices = results.get('mcx_spot_prices', {})
 
+    try:
         os.makedirs('data', exist_ok=True)
-
-        with open('data/mcx_cache.json', 'w') as f:
-            json.dump(mcx_prices, f, indent=2)
-
-        logger.info(f"✅ Saved MCX prices to data/mcx_cache.json")
-        logger.info(f"   Gold: ₹{mcx_prices.get('gold_per_gram', 0)}/g")
-        logger.info(f"   Silver: ₹{mcx_prices.get('silver_per_gram', 0)}/g")
-
-    except Exception as e:
+        write_json_file(MCX_CACHE_FILE, mcx_prices)  # orjson when installed, atomic replace
+    except (OSError, TypeError, ValueError) as e:
         logger.error(f"❌ Failed to save mcx_cache.json: {e}")
+        return
+
+    logger.info(f"✅ Saved MCX prices to {MCX_CACHE_FILE}")
+    logger.info(f"   Gold: ₹{mcx_prices.get('gold_per_gram', 0)}/g")
+    logger.info(f"   Silver: ₹{mcx_prices.get('silver_per_gram', 0)}/g")
 
-'''def copy_static_cache():
-    """Copy etf_static_cache.csv from project root to data/ folder"""
-    try:
-        src = Path('etf_static_cache.csv')
-        dst = Path('data/etf_static_cache.csv')
-
-        if src.exists():
-            os.makedirs('data', exist_ok=True)
-            shutil.copy(src, dst)
-            logger.info(f"✅ Copied etf_static_cache.csv to data/")
-        else:
-            logger.warning("⚠️ etf_static_cache.csv not found in project root")
-    except Exception as e:
-        logger.error(f"❌ Failed to copy static cache: {e}")
-'''
 def update_last_updated():
     """Update last_updated.txt timestamp"""
     try:
@@ -96,8 +85,7 @@ def main():
     save_etf_cache(results)      # ← Creates data/etf_cache.csv
     save_mcx_cache(results)      # ← Creates data/mcx_cache.json
 
-    # Copy internal files to data/ folder (for consistency)
-    #copy_static_cache()          # ← Copies etf_static_cache.csv to data/
+    # etf_static_cache.csv is written straight to data/ by the scraper - nothing to copy
     update_last_updated()        # ← Updates last_updated.txt
 
     logger.info("✅ Done!")